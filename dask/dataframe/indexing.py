@@ -320,9 +320,9 @@ def _partitions_of_index_values(divisions, values):
 
     results = defaultdict(list)
     values = pd.Index(values, dtype=object)
-    for val in values:
-        i = bisect.bisect_right(divisions, val)
-        div = min(len(divisions) - 2, max(0, i - 1))
+    indices = np.searchsorted(np.array(divisions, dtype=object), values, side="right")
+    indices = np.clip(indices - 1, 0, len(divisions) - 2)
+    for val, div in zip(values, indices.tolist()):
         results[div].append(val)
     return results
 
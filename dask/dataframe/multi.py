@@ -61,8 +61,8 @@ from functools import partial, wraps
 import numpy as np
 import pandas as pd
 from pandas.api.types import is_categorical_dtype, is_dtype_equal
-from tlz import first, merge_sorted, unique
 
+from .. import config
 from ..base import is_dask_collection, tokenize
 from ..highlevelgraph import HighLevelGraph
 from ..layers import BroadcastJoinLayer
@@ -126,31 +126,60 @@ def align_partitions(*dfs):
             "to set the index."
         )
 
-    divisions = list(unique(merge_sorted(*[df.divisions for df in dfs1])))
+    # When every frame already has the same divisions - e.g. they come from
+    # the same upstream shuffle - alignment is a no-op, so skip the
+    # repartition step (which would otherwise add a copy layer per frame)
+    if dfs1:
+        divisions0 = dfs1[0].divisions
+        if all(df.divisions == divisions0 for df in dfs if isinstance(df, _Frame)):
+            result = [
+                [(df._name, i) if isinstance(df, _Frame) else None for df in dfs]
+                for i in range(len(divisions0) - 1)
+            ]
+            return list(dfs), divisions0, result
+
+    # Merge and deduplicate all divisions in one C-level pass.  Object dtype
+    # preserves the original division values (e.g. Timestamps) exactly.
+    if len(dfs1) == 1:
+        divisions = np.unique(np.array(dfs1[0].divisions, dtype=object))
+    elif dfs1:
+        divisions = np.unique(
+            np.concatenate([np.array(df.divisions, dtype=object) for df in dfs1])
+        )
+    else:
+        divisions = np.array([], dtype=object)
     if len(divisions) == 1:  # single value for index
-        divisions = (divisions[0], divisions[0])
+        divisions = np.concatenate([divisions, divisions])
     dfs2 = [
-        df.repartition(divisions, force=True) if isinstance(df, _Frame) else df
+        df.repartition(divisions.tolist(), force=True) if isinstance(df, _Frame) else df
         for df in dfs
     ]
 
-    result = list()
-    inds = [0 for df in dfs]
-    for d in divisions[:-1]:
-        L = list()
-        for i, df in enumerate(dfs2):
-            if isinstance(df, _Frame):
-                j = inds[i]
-                divs = df.divisions
-                if j < len(divs) - 1 and divs[j] == d:
-                    L.append((df._name, inds[i]))
-                    inds[i] += 1
-                else:
-                    L.append(None)
-            else:  # Scalar has no divisions
-                L.append(None)
-        result.append(L)
-    return dfs2, tuple(divisions), result
+    # Each frame's divisions form a sorted subsequence of the merged
+    # divisions, so a single searchsorted per frame locates the output rows
+    # where that frame contributes a partition.  Non-frames (Scalars) have no
+    # divisions and contribute nothing.
+    divisions = tuple(divisions.tolist())
+    divisions_arr = None
+    result = [[None] * len(dfs2) for _ in range(len(divisions) - 1)]
+    for i, df in enumerate(dfs2):
+        if isinstance(df, _Frame):
+            name = df._name
+            divs = df.divisions
+            if divs == divisions:
+                # Frame spans every output division (the common case after
+                # the force repartition above)
+                for j in range(len(divs) - 1):
+                    result[j][i] = (name, j)
+            else:
+                if divisions_arr is None:
+                    divisions_arr = np.array(divisions[:-1], dtype=object)
+                positions = np.searchsorted(
+                    divisions_arr, np.array(divs[:-1], dtype=object)
+                )
+                for j, p in enumerate(positions):
+                    result[p][i] = (name, j)
+    return dfs2, divisions, result
 
 
 def _maybe_align_partitions(args):
@@ -209,11 +238,17 @@ def require(divisions, parts, required=None):
     """
     if not required:
         return divisions, parts
+    # One boolean presence matrix over all parts, then a C-level scan per
+    # required input instead of a Python pass over ``parts`` for each
+    presence = np.array([[p is not None for p in part] for part in parts], dtype=bool)
     for i in required:
-        present = [j for j, p in enumerate(parts) if p[i] is not None]
-        divisions = tuple(divisions[min(present) : max(present) + 2])
-        parts = tuple(parts[min(present) : max(present) + 1])
-    return divisions, parts
+        idx = np.flatnonzero(presence[:, i])
+        lo, hi = idx[0], idx[-1] + 1
+        if lo != 0 or hi != len(parts):
+            divisions = divisions[lo : hi + 1]
+            parts = parts[lo:hi]
+            presence = presence[lo:hi]
+    return tuple(divisions), tuple(parts)
 
 
 ###############################################################
@@ -285,6 +320,48 @@ def merge_chunk(lhs, *args, **kwargs):
     return out
 
 
+_merge_meta_cache = {}
+
+
+def merge_meta(lhs_meta, rhs_meta, kwargs):
+    """Compute the metadata of a merge from a pair of dummy frames
+
+    The dummy ``pd.merge`` runs the full suffix/dtype machinery just to
+    learn the output schema, and pipelines tend to repeat identically
+    shaped merges, so memoize the result keyed on the tokenized inputs.
+    Returns a copy so callers may mutate their meta freely.
+    """
+    key = tokenize(lhs_meta, rhs_meta, kwargs)
+    try:
+        meta = _merge_meta_cache[key]
+    except KeyError:
+        if len(_merge_meta_cache) >= 256:
+            _merge_meta_cache.clear()
+        meta = _merge_meta_cache[key] = lhs_meta.merge(rhs_meta, **kwargs)
+    return meta.copy()
+
+
+def merge_chunk_aligned(lhs, rhs, **kwargs):
+    """Indexed inner merge of two partitions with already-aligned indexes
+
+    When both partition indexes are identical and unique the merge is a pure
+    column concatenation, so pandas' index-join machinery can be skipped.
+    Falls back to ``merge_chunk`` otherwise.  Only emitted for frames that
+    share no column names, so suffix handling never applies.
+    """
+    if lhs.index.is_unique and rhs.index.is_unique and lhs.index.equals(rhs.index):
+        out = methods.concat([lhs, rhs], axis=1)
+        if out.index.names != lhs.index.names:
+            # concat nulls the index name when the inputs disagree, while
+            # merge keeps the left frame's name
+            out.index = out.index.set_names(lhs.index.names)
+        empty_index_dtype = kwargs.get("empty_index_dtype", None)
+        if len(out) == 0 and empty_index_dtype is not None:
+            out.index = out.index.astype(empty_index_dtype)
+        return out
+    return merge_chunk(lhs, rhs, **kwargs)
+
+
 def merge_indexed_dataframes(lhs, rhs, left_index=True, right_index=True, **kwargs):
     """Join two partitioned dataframes along their index"""
     how = kwargs.get("how", "left")
@@ -296,13 +373,27 @@ def merge_indexed_dataframes(lhs, rhs, left_index=True, right_index=True, **kwar
 
     name = "join-indexed-" + tokenize(lhs, rhs, **kwargs)
 
-    meta = lhs._meta_nonempty.merge(rhs._meta_nonempty, **kwargs)
+    meta = merge_meta(lhs._meta_nonempty, rhs._meta_nonempty, kwargs)
     kwargs["empty_index_dtype"] = meta.index.dtype
     kwargs["categorical_columns"] = meta.select_dtypes(include="category").columns
 
+    chunk = merge_chunk
+    if (
+        how == "inner"
+        and left_index
+        and right_index
+        and not kwargs.get("indicator")
+        and kwargs.get("left_on") is None
+        and kwargs.get("right_on") is None
+        and is_dataframe_like(lhs._meta)
+        and is_dataframe_like(rhs._meta)
+        and len(lhs.columns.intersection(rhs.columns)) == 0
+    ):
+        chunk = merge_chunk_aligned
+
     dsk = dict()
     for i, (a, b) in enumerate(parts):
-        dsk[(name, i)] = (apply, merge_chunk, [a, b], kwargs)
+        dsk[(name, i)] = (apply, chunk, [a, b], kwargs)
 
     graph = HighLevelGraph.from_collections(name, dsk, dependencies=[lhs, rhs])
     return new_dd_object(graph, name, meta, divisions)
@@ -332,6 +423,24 @@ def hash_join(
     """
     if npartitions is None:
         npartitions = max(lhs.npartitions, rhs.npartitions)
+    else:
+        # Coalesce over-partitioned inputs before the shuffle.  The shuffle
+        # graph scales with input partitions times output partitions, so
+        # reducing input partitions first makes it substantially smaller.
+        # Skip this when the join key is itself a dask collection, since it
+        # is partition-aligned with the frame.
+        if lhs.npartitions > npartitions and not isinstance(left_on, _Frame):
+            lhs = lhs.repartition(npartitions=npartitions)
+        if rhs.npartitions > npartitions and not isinstance(right_on, _Frame):
+            rhs = rhs.repartition(npartitions=npartitions)
+
+    if how in ("leftsemi", "leftanti") and not isinstance(right_on, _Frame):
+        # Semi/anti joins only consult key membership on the right, so rows
+        # duplicated within a partition can be dropped before they are
+        # shuffled, reducing shuffle volume without changing the result
+        subset = right_on if isinstance(right_on, list) else [right_on]
+        if set(subset).issubset(rhs.columns):
+            rhs = rhs.map_partitions(M.drop_duplicates, subset=subset, meta=rhs._meta)
 
     lhs2 = shuffle_func(
         lhs, left_on, npartitions=npartitions, shuffle=shuffle, max_branch=max_branch
@@ -366,7 +475,7 @@ def hash_join(
     # Avoid using dummy data for a collection it is empty
     _lhs_meta = lhs._meta_nonempty if len(lhs.columns) else lhs._meta
     _rhs_meta = rhs._meta_nonempty if len(rhs.columns) else rhs._meta
-    meta = _lhs_meta.merge(_rhs_meta, **kwargs)
+    meta = merge_meta(_lhs_meta, _rhs_meta, kwargs)
 
     if isinstance(left_on, list):
         left_on = (list, tuple(left_on))
@@ -379,10 +488,14 @@ def hash_join(
     kwargs["empty_index_dtype"] = meta.index.dtype
     kwargs["categorical_columns"] = meta.select_dtypes(include="category").columns
 
-    dsk = {
-        (name, i): (apply, merge_chunk, [(lhs2._name, i), (rhs2._name, i)], kwargs)
-        for i in range(npartitions)
-    }
+    # Bind the invariant keywords once rather than routing every task
+    # through apply; this also keeps each task tuple small
+    merge_fn = partial(merge_chunk, **kwargs)
+    lhs_name = lhs2._name
+    rhs_name = rhs2._name
+    dsk = {}
+    for i in range(npartitions):
+        dsk[(name, i)] = (merge_fn, (lhs_name, i), (rhs_name, i))
 
     divisions = [None] * (npartitions + 1)
     graph = HighLevelGraph.from_collections(name, dsk, dependencies=[lhs2, rhs2])
@@ -393,13 +506,13 @@ def single_partition_join(left, right, **kwargs):
     # if the merge is performed on_index, divisions can be kept, otherwise the
     # new index will not necessarily correspond with the current divisions
 
-    meta = left._meta_nonempty.merge(right._meta_nonempty, **kwargs)
+    meta = merge_meta(left._meta_nonempty, right._meta_nonempty, kwargs)
     kwargs["empty_index_dtype"] = meta.index.dtype
     kwargs["categorical_columns"] = meta.select_dtypes(include="category").columns
 
     name = "merge-" + tokenize(left, right, **kwargs)
     if left.npartitions == 1 and kwargs["how"] in allowed_right:
-        left_key = first(left.__dask_keys__())
+        left_key = left.__dask_keys__()[0]
         dsk = {
             (name, i): (apply, merge_chunk, [left_key, right_key], kwargs)
             for i, right_key in enumerate(right.__dask_keys__())
@@ -413,7 +526,7 @@ def single_partition_join(left, right, **kwargs):
             divisions = [None for _ in right.divisions]
 
     elif right.npartitions == 1 and kwargs["how"] in allowed_left:
-        right_key = first(right.__dask_keys__())
+        right_key = right.__dask_keys__()[0]
         dsk = {
             (name, i): (apply, merge_chunk, [left_key, right_key], kwargs)
             for i, left_key in enumerate(left.__dask_keys__())
@@ -639,8 +752,11 @@ def merge(
         bcast_side = "left" if left.npartitions < right.npartitions else "right"
         n_small = min(left.npartitions, right.npartitions)
         n_big = max(left.npartitions, right.npartitions)
+        # Resolve the effective shuffle method the same way shuffle() does,
+        # so a config-level "tasks" setting also enables the broadcast path
+        shuffle_method = shuffle or config.get("shuffle", None)
         if (
-            shuffle == "tasks"
+            shuffle_method == "tasks"
             and how in ("inner", "left", "right")
             and how != bcast_side
             and broadcast is not False
@@ -988,31 +1104,37 @@ def concat_indexed_dataframes(dfs, axis=0, join="outer", ignore_order=False, **k
         filter_warning=warn,
         **kwargs,
     )
-    empties = [strip_unknown_categories(df._meta) for df in dfs]
-
     dfs2, divisions, parts = align_partitions(*dfs)
 
     name = "concat-indexed-" + tokenize(join, *dfs)
 
-    parts2 = [
-        [df if df is not None else empty for df, empty in zip(part, empties)]
-        for part in parts
-    ]
-
     filter_warning = True
     uniform = False
 
-    dsk = dict(
-        (
-            (name, i),
-            (methods.concat, part, axis, join, uniform, filter_warning, kwargs),
-        )
-        for i, part in enumerate(parts2)
-    )
-    for df in dfs2:
-        dsk.update(df.dask)
-
-    return new_dd_object(dsk, name, meta, divisions)
+    # All task arguments other than the parts are invariant; concatenate a
+    # pre-built tail instead of constructing each 7-tuple element-wise.
+    # Most rows have every input present; only rebuild the rows that need an
+    # empty-frame placeholder.  Placeholders are built lazily on first use
+    # and embedded in the graph once as a shared key rather than by value in
+    # every task.
+    task_tail = (axis, join, uniform, filter_warning, kwargs)
+    empty_keys = [None] * len(dfs)
+    dsk = {}
+    for i, part in enumerate(parts):
+        if None in part:
+            row = []
+            for j, df in enumerate(part):
+                if df is None:
+                    if empty_keys[j] is None:
+                        empty_keys[j] = (name + "-empty", j)
+                        dsk[empty_keys[j]] = strip_unknown_categories(dfs[j]._meta)
+                    df = empty_keys[j]
+                row.append(df)
+            part = row
+        dsk[(name, i)] = (methods.concat, part) + task_tail
+
+    graph = HighLevelGraph.from_collections(name, dsk, dependencies=dfs2)
+    return new_dd_object(graph, name, meta, divisions)
 
 
 def stack_partitions(dfs, divisions, join="outer", ignore_order=False, **kwargs):
@@ -1030,10 +1152,11 @@ def stack_partitions(dfs, divisions, join="outer", ignore_order=False, **kwargs)
             **kwargs,
         )
     )
-    empty = strip_unknown_categories(meta)
 
     name = "concat-{0}".format(tokenize(*dfs))
+    empty_key = name + "-empty"
     dsk = {}
+    dependencies = []
     i = 0
     for df in dfs:
         # dtypes of all dfs need to be coherent
@@ -1059,7 +1182,7 @@ def stack_partitions(dfs, divisions, join="outer", ignore_order=False, **kwargs)
                 df = df.astype(meta.dtype)
         else:
             pass  # TODO: there are other non-covered cases here
-        dsk.update(df.dask)
+        dependencies.append(df)
         # An error will be raised if the schemas or categories don't match. In
         # this case we need to pass along the meta object to transform each
         # partition, so they're all equivalent.
@@ -1072,6 +1195,11 @@ def stack_partitions(dfs, divisions, join="outer", ignore_order=False, **kwargs)
         filter_warning = True
         uniform = False
 
+        if not match and empty_key not in dsk:
+            # Built only when some input actually needs coercing, and
+            # serialized once instead of inlining a copy into every task
+            dsk[empty_key] = strip_unknown_categories(meta)
+
         for key in df.__dask_keys__():
             if match:
                 dsk[(name, i)] = key
@@ -1079,12 +1207,13 @@ def stack_partitions(dfs, divisions, join="outer", ignore_order=False, **kwargs)
                 dsk[(name, i)] = (
                     apply,
                     methods.concat,
-                    [[empty, key], 0, join, uniform, filter_warning],
+                    [[empty_key, key], 0, join, uniform, filter_warning],
                     kwargs,
                 )
             i += 1
 
-    return new_dd_object(dsk, name, meta, divisions)
+    graph = HighLevelGraph.from_collections(name, dsk, dependencies=dependencies)
+    return new_dd_object(graph, name, meta, divisions)
 
 
 def concat(
@@ -1465,7 +1594,7 @@ def broadcast_join(
     )
 
     # dummy result
-    meta = lhs._meta_nonempty.merge(rhs._meta_nonempty, **merge_kwargs)
+    meta = merge_meta(lhs._meta_nonempty, rhs._meta_nonempty, merge_kwargs)
     merge_kwargs["empty_index_dtype"] = meta.index.dtype
     merge_kwargs["categorical_columns"] = meta.select_dtypes(include="category").columns
 
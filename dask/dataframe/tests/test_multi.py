@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
+import dask
 import dask.dataframe as dd
 from dask.base import compute_as_if_collection
 from dask.dataframe._compat import tm
@@ -23,6 +24,7 @@ from dask.dataframe.utils import (
     has_known_categories,
     make_meta_util,
 )
+from dask.layers import BroadcastJoinLayer
 
 
 def test_align_partitions():
@@ -201,6 +203,39 @@ def test_merge_indexed_dataframe_to_indexed_dataframe():
     )
 
 
+def test_merge_indexed_aligned_concat_fast_path():
+    # Identical unique indexes take the concat fast path in
+    # merge_chunk_aligned
+    A = pd.DataFrame({"x": range(12)}, index=range(12))
+    B = pd.DataFrame({"y": range(0, 24, 2)}, index=range(12))
+    a = dd.from_pandas(A, npartitions=3)
+    b = dd.from_pandas(B, npartitions=4)
+    assert_eq(
+        dd.merge(a, b, left_index=True, right_index=True, how="inner"),
+        pd.merge(A, B, left_index=True, right_index=True, how="inner"),
+    )
+
+    # Differing index names: merge keeps the left frame's name
+    A2 = A.rename_axis("L")
+    B2 = B.rename_axis("R")
+    a2 = dd.from_pandas(A2, npartitions=3)
+    b2 = dd.from_pandas(B2, npartitions=4)
+    assert_eq(
+        dd.merge(a2, b2, left_index=True, right_index=True, how="inner"),
+        pd.merge(A2, B2, left_index=True, right_index=True, how="inner"),
+    )
+
+    # Duplicate index values need the cartesian merge fallback
+    A3 = pd.DataFrame({"x": range(6)}, index=[1, 1, 2, 2, 3, 3])
+    B3 = pd.DataFrame({"y": range(6)}, index=[1, 2, 2, 3, 3, 3])
+    a3 = dd.from_pandas(A3, npartitions=2)
+    b3 = dd.from_pandas(B3, npartitions=2)
+    assert_eq(
+        dd.merge(a3, b3, left_index=True, right_index=True, how="inner"),
+        pd.merge(A3, B3, left_index=True, right_index=True, how="inner"),
+    )
+
+
 def list_eq(aa, bb):
     if isinstance(aa, dd.DataFrame):
         a = aa.compute(scheduler="sync")
@@ -2325,3 +2360,25 @@ def test_merge_tasks_large_to_small(how, npartitions, base):
         pd_result.sort_values("y"),
         check_index=False,
     )
+
+
+def test_merge_broadcast_from_config():
+    # A config-level tasks shuffle enables the broadcast join without an
+    # explicit shuffle= argument
+    lg = pd.DataFrame({"x": np.arange(300), "y": np.arange(300)})
+    sm = pd.DataFrame({"x": np.arange(10), "z": np.arange(10)})
+    ddf_lg = dd.from_pandas(lg, npartitions=30)
+    ddf_sm = dd.from_pandas(sm, npartitions=2)
+
+    with dask.config.set({"shuffle": "tasks"}):
+        result = dd.merge(ddf_lg, ddf_sm, on="x", how="inner")
+
+    assert any(
+        isinstance(layer, BroadcastJoinLayer)
+        for layer in result.__dask_graph__().layers.values()
+    )
+    assert_eq(
+        result.compute().sort_values("x"),
+        pd.merge(lg, sm, on="x", how="inner").sort_values("x"),
+        check_index=False,
+    )